@@ -16,23 +16,27 @@ import re
 import sys
 import urllib.parse
 import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 from plexapi.server import PlexServer
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process, utils
 
 
 # ── Configuration ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class PushoverConfig:
     """Pushover notification settings."""
     user_key: str
     app_token: str
 
 
-@dataclass
+@dataclass(slots=True)
 class KodiConfig:
     """Kodi connection settings."""
     url: str
@@ -41,7 +45,7 @@ class KodiConfig:
     password: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Script configuration loaded from JSON."""
     plex_url: str
@@ -54,6 +58,7 @@ class Config:
     dry_run: bool = False
     pushover: PushoverConfig | None = None
     title_overrides: dict[str, str] = field(default_factory=dict)
+    cache_file: str | None = None
 
     @classmethod
     def from_file(cls, path: str) -> "Config":
@@ -86,6 +91,11 @@ class Config:
 
 # ── Logging Setup ──────────────────────────────────────────────────────────────
 
+# Banner and section rules used in the log and interactive output
+SEPARATOR = "=" * 60
+DIVIDER = "-" * 60
+
+
 class ColorFormatter(logging.Formatter):
     """Adds color codes to console log output."""
     COLORS = {
@@ -116,6 +126,8 @@ def setup_logging(log_file: str | None = None) -> logging.Logger:
     """Configure console (colored) and optional file logging."""
     logger = logging.getLogger("kodi2plex")
     logger.setLevel(logging.DEBUG)
+    # Records are fully handled here; don't pass them on to root handlers
+    logger.propagate = False
 
     console = logging.StreamHandler(sys.stdout)
     console.setLevel(logging.INFO)
@@ -138,10 +150,27 @@ def setup_logging(log_file: str | None = None) -> logging.Logger:
 
 # ── Title Normalization ────────────────────────────────────────────────────────
 
+_ARTICLES = ("the", "a", "an")
+_RE_PUNCT = re.compile(r"[^\w\s]")
+# The ASCII characters _RE_PUNCT removes, for a bytes.translate fast path
+_ASCII_PUNCT = bytes(
+    c for c in range(128)
+    if not (chr(c).isalnum() or chr(c) == "_" or chr(c).isspace())
+)
+# thefuzz's token_sort_ratio ran both titles through
+# full_process(force_ascii=True): code points 128-255 are deleted, then
+# rapidfuzz's default_process lowercases and blanks other non-alphanumerics
+_LATIN1 = dict.fromkeys(range(128, 256))
+
+
+@lru_cache(maxsize=None)
 def normalize_title(title: str) -> str:
     """
     Normalize a title for fuzzy comparison.
 
+    Results are memoized: unmatched playlist titles are normalized again
+    when they are offered in interactive mode.
+
     - Lowercase
     - Replace '&' with 'and'
     - Strip leading articles (the, a, an)
@@ -150,17 +179,42 @@ def normalize_title(title: str) -> str:
     - Collapse whitespace
     """
     t = title.lower().strip()
-    t = t.replace("&amp;", "and").replace("&", "and")
-    t = re.sub(r"^(the|a|an)\s+", "", t)
-    t = re.sub(r"\s*\(\d{4}\)\s*$", "", t)  # Strip trailing year
-    t = re.sub(r"[^\w\s]", "", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    if "&" in t:
+        t = t.replace("&amp;", "and").replace("&", "and")
+    # Article and year are plain prefix/suffix checks; str methods beat a
+    # regex on short strings. isspace/isdecimal match \s and \d exactly.
+    if t.startswith(_ARTICLES):
+        for article in _ARTICLES:
+            if t.startswith(article) and t[len(article):len(article) + 1].isspace():
+                t = t[len(article):].lstrip()
+                break
+    if t.endswith(")") and len(t) >= 6 and t[-6] == "(" and t[-5:-1].isdecimal():
+        t = t[:-6].rstrip()
+    # Most titles are plain words; \w covers everything str.isalnum() does,
+    # so the punctuation pass is only needed when that check fails
+    if not t.replace(" ", "").isalnum():
+        if t.isascii():
+            t = t.encode("ascii").translate(None, _ASCII_PUNCT).decode("ascii")
+        else:
+            t = _RE_PUNCT.sub("", t)
+    return " ".join(t.split())
+
+
+@lru_cache(maxsize=None)
+def sort_tokens(title: str) -> str:
+    """
+    Preprocess a normalized title for token_sort_ratio and sort its words.
+
+    The preprocessing is thefuzz's (see _LATIN1), so fuzz.ratio on the
+    results is exactly thefuzz's token_sort_ratio, without preprocessing,
+    splitting and sorting both titles for every pair compared.
+    """
+    return " ".join(sorted(utils.default_process(title.translate(_LATIN1)).split()))
 
 
 # ── Kodi JSON-RPC ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistInfo:
     """Playlist data fetched from Kodi."""
     name: str
@@ -194,8 +248,9 @@ def kodi_jsonrpc(kodi: KodiConfig, method: str, params: dict) -> dict:
         b64 = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
         req.add_header("Authorization", f"Basic {b64}")
 
+    # json.loads detects UTF-8 in bytes itself, avoiding a separate decode
     with urllib.request.urlopen(req) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
+        data = json.loads(resp.read())
 
     if "error" in data:
         error = data["error"]
@@ -217,8 +272,8 @@ def fetch_kodi_playlist(kodi: KodiConfig, logger: logging.Logger) -> PlaylistInf
         f"special://profile/playlists/video/{playlist_name}.xsp"
     )
 
-    logger.info(f"Fetching playlist '{playlist_name}' from Kodi...")
-    logger.debug(f"Playlist path: {playlist_path}")
+    logger.info("Fetching playlist '%s' from Kodi...", playlist_name)
+    logger.debug("Playlist path: %s", playlist_path)
 
     result = kodi_jsonrpc(kodi, "Files.GetDirectory", {
         "directory": playlist_path,
@@ -239,7 +294,7 @@ def fetch_kodi_playlist(kodi: KodiConfig, logger: logging.Logger) -> PlaylistInf
 
 # ── Plex Matching ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching a playlist title to a Plex show."""
     playlist_title: str
@@ -249,13 +304,237 @@ class MatchResult:
     matched: bool = False
 
 
-def find_best_match(
-    playlist_title: str,
+def ratio_length_bounds(length: int, min_ratio: int) -> tuple[int, int]:
+    """
+    Return the (shortest, longest) title lengths that can still reach
+    min_ratio against a title of the given length.
+
+    fuzz.ratio is bounded by 2 * min(a, b) / (a + b) * 100, since at most
+    the shorter title can be shared. Scores are rounded to integers, so
+    the bound is checked against min_ratio - 0.5.
+    """
+    if min_ratio <= 0:
+        return 0, sys.maxsize
+    k = 2 * min_ratio - 1
+    if k >= 400:
+        return length, length
+    shortest = -(-k * length // (400 - k))
+    longest = (400 - k) * length // k
+    return shortest, longest
+
+
+def cdist_scores(
+    queries: list[str],
+    choices: list[str],
+    scorer,
+    score_cutoff: int = 0,
+) -> np.ndarray:
+    """
+    Compute a (queries, choices) uint8 score matrix on all CPU cores.
+
+    rapidfuzz parallelizes cdist over its first argument, so the longer
+    side goes first and the result is transposed back. All scorers used
+    here are symmetric, which makes the swap safe. Inputs are expected to
+    be normalized already (see ``normalize_title``), so no processor runs.
+
+    Scores are rounded like thefuzz's int(round(score)), half to even.
+    cdist's own integer dtypes round halves up, so scores are computed as
+    floats and rounded with np.rint.
+
+    score_cutoff is an integer score: pairs whose rounded score falls below
+    it are reported as 0. rapidfuzz compares the cutoff with the unrounded
+    score, so it is passed on as score_cutoff - 0.5 to keep pairs that
+    round up to it.
+    """
+    kwargs = dict(
+        scorer=scorer, processor=None, dtype=np.float64, workers=-1,
+        score_cutoff=score_cutoff - 0.5 if score_cutoff > 0 else 0,
+    )
+    if len(choices) > len(queries):
+        scores = process.cdist(choices, queries, **kwargs).T
+    else:
+        scores = process.cdist(queries, choices, **kwargs)
+    return np.rint(scores).astype(np.uint8)
+
+
+def char_counts(titles: list[str], alphabet: np.ndarray) -> np.ndarray:
+    """
+    Count how often each alphabet character occurs in each title.
+
+    alphabet is a sorted array of code points; other characters are
+    ignored. Returns a (titles, alphabet) matrix.
+    """
+    codes = np.frombuffer("".join(titles).encode("utf-32-le"), dtype=np.uint32)
+    rows = np.repeat(np.arange(len(titles)), [len(t) for t in titles])
+    cols = np.searchsorted(alphabet, codes)
+    known = cols < len(alphabet)
+    known[known] = alphabet[cols[known]] == codes[known]
+
+    counts = np.zeros((len(titles), len(alphabet)), dtype=np.int32)
+    np.add.at(counts, (rows[known], cols[known]), 1)
+    return counts
+
+
+def score_titles(
+    normalized_playlist: list[str],
+    normalized_plex: list[str],
+    score_cutoff: int = 0,
+    min_ratio: int = 0,
+    best_only: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score every normalized playlist title against every normalized Plex title.
+
+    Playlist titles are grouped by length and each strategy is computed in
+    one batched rapidfuzz ``cdist`` call per group (see ``cdist_scores``).
+    Shows are indexed by normalized length, so each call only covers the
+    window of shows whose length can produce a useful score. Returns
+    (score, ratio) matrices of shape (titles, shows), where score is the
+    best combined strategy score and ratio is the basic ``fuzz.ratio``.
+
+    token_sort_ratio and partial_ratio scores below score_cutoff are
+    reported as 0, which lets rapidfuzz abandon hopeless pairs early.
+    Pairs whose lengths rule out a basic ratio of min_ratio skip ratio
+    (reported as 0). token_sort_ratio preprocesses titles the way thefuzz
+    did, which can change their lengths, so it gets its own length index:
+    pairs whose preprocessed lengths rule out min_ratio or score_cutoff
+    skip it (reported as 0).
+
+    With best_only, partial_ratio (by far the most expensive strategy) is
+    deferred until ratio and token_sort_ratio are known, and only computed
+    where it can still change a title's best match: titles with an exact
+    ratio hit skip it, and scores that round below a title's best
+    ratio/token_sort score are cut off.
+
+    When partial_ratio runs with a cutoff, each title is only scored
+    against its own candidates: the shows whose shared characters leave
+    them able to reach that title's cutoff.
+    """
+    def length_index(lengths: np.ndarray):
+        by_length = np.argsort(lengths, kind="stable")
+        sorted_lengths = lengths[by_length]
+
+        def length_window(shortest: int, longest: int) -> np.ndarray:
+            lo = np.searchsorted(sorted_lengths, shortest, side="left")
+            hi = np.searchsorted(sorted_lengths, longest, side="right")
+            return by_length[lo:hi]
+        return length_window
+
+    len_playlist = np.array([len(t) for t in normalized_playlist])
+    len_plex = np.array([len(t) for t in normalized_plex])
+    length_window = length_index(len_plex)
+    query_lengths = np.unique(len_playlist).tolist()
+
+    shape = (len(normalized_playlist), len(normalized_plex))
+    ratio_scores = np.zeros(shape, dtype=np.uint8)
+    token_sort_scores = np.zeros(shape, dtype=np.uint8)
+    partial_scores = np.zeros(shape, dtype=np.uint8)
+
+    for length in query_lengths:
+        window = length_window(*ratio_length_bounds(length, min_ratio))
+        if not window.size:
+            continue
+        rows = np.flatnonzero(len_playlist == length)
+        ratio_scores[np.ix_(rows, window)] = cdist_scores(
+            [normalized_playlist[i] for i in rows],
+            [normalized_plex[i] for i in window],
+            fuzz.ratio,
+        )
+
+    sorted_playlist = [sort_tokens(t) for t in normalized_playlist]
+    sorted_plex = [sort_tokens(t) for t in normalized_plex]
+    len_sorted_playlist = np.array([len(t) for t in sorted_playlist])
+    sorted_window = length_index(np.array([len(t) for t in sorted_plex]))
+    for length in np.unique(len_sorted_playlist).tolist():
+        window = sorted_window(
+            *ratio_length_bounds(length, max(min_ratio, score_cutoff))
+        )
+        if not window.size:
+            continue
+        rows = np.flatnonzero(len_sorted_playlist == length)
+        token_sort_scores[np.ix_(rows, window)] = cdist_scores(
+            [sorted_playlist[i] for i in rows],
+            [sorted_plex[i] for i in window],
+            fuzz.ratio, score_cutoff,
+        )
+
+    scores = np.maximum(ratio_scores, token_sort_scores)
+    if best_only:
+        row_best = scores.max(axis=1)
+        exact_hit = (ratio_scores == 100).any(axis=1)
+    if best_only or score_cutoff:
+        alphabet = np.unique(np.frombuffer(
+            "".join(normalized_playlist).encode("utf-32-le"), dtype=np.uint32,
+        ))
+        playlist_counts = char_counts(normalized_playlist, alphabet)
+        plex_counts = char_counts(normalized_plex, alphabet)
+
+    # Only allow partial_ratio when title lengths are within 2x
+    for length in query_lengths:
+        window = length_window((length + 1) // 2, 2 * length)
+        if not length or not window.size:
+            continue
+        rows = np.flatnonzero(len_playlist == length)
+        if best_only:
+            rows = rows[~exact_hit[rows]]
+            if not rows.size:
+                continue
+        if not (best_only or score_cutoff):
+            partial_scores[np.ix_(rows, window)] = cdist_scores(
+                [normalized_playlist[i] for i in rows],
+                [normalized_plex[i] for i in window],
+                fuzz.partial_ratio,
+            )
+            continue
+
+        # Each title only needs partial_ratio against the shows that can
+        # still reach its cutoff. partial_ratio can match at most the
+        # characters both titles share (counted with repeats), so with m
+        # the shorter length it is bounded by 200 * shared / (m + shared)
+        cutoffs = np.full(rows.size, score_cutoff)
+        if best_only:
+            # A partial score that rounds to the title's best can still win
+            # the tie on ratio; cdist_scores keeps scores that round up to
+            # the cutoff, so it is not lost
+            cutoffs = np.maximum(cutoffs, row_best[rows])
+        shared = np.zeros((rows.size, window.size), dtype=np.int32)
+        for col in np.flatnonzero(playlist_counts[rows].any(axis=0)):
+            shared += np.minimum(
+                playlist_counts[rows, col][:, None],
+                plex_counts[window, col][None, :],
+            )
+        shortest = np.minimum(length, len_plex[window])[None, :]
+        reachable = (
+            400 * shared >= (2 * cutoffs[:, None] - 1) * (shortest + shared)
+        )
+        # Each cutoff is a rounded score; cdist_scores allows for the
+        # rounding, like the shared-character bound above
+        for row, cutoff, candidates in zip(rows, cutoffs.tolist(), reachable):
+            choices = window[candidates]
+            if choices.size:
+                partial_scores[row, choices] = cdist_scores(
+                    [normalized_playlist[row]],
+                    [normalized_plex[i] for i in choices],
+                    fuzz.partial_ratio, cutoff,
+                )[0]
+
+    scores = np.maximum(scores, partial_scores)
+    return scores, ratio_scores
+
+
+def find_best_matches(
+    playlist_titles: list[str],
     plex_shows: list,
+    normalized_plex: list[str],
     threshold: int
-) -> MatchResult:
+) -> list[MatchResult]:
     """
-    Find the best fuzzy match for a playlist title in the Plex library.
+    Find the best fuzzy match for each playlist title in the Plex library.
+
+    Titles with an exact normalized match are resolved by lookup; the rest
+    are scored against all shows in one batch (see ``score_titles``).
+    normalized_plex holds the pre-normalized title of each show in
+    plex_shows. Results are returned in the order of playlist_titles.
 
     Matching strategy:
     - ratio and token_sort_ratio are always used
@@ -265,91 +544,222 @@ def find_best_match(
     - A minimum basic ratio of 70 is required as a guard rail to prevent
       matches that only score well on token_sort or partial strategies
     """
-    normalized_playlist = normalize_title(playlist_title)
-    len_playlist = len(normalized_playlist)
-    best_score = 0
-    best_ratio = 0
-    best_show = None
-
-    for show in plex_shows:
-        normalized_plex = normalize_title(show.title)
-        len_plex = len(normalized_plex)
-
-        # Always use ratio and token_sort_ratio
-        ratio_score = fuzz.ratio(normalized_playlist, normalized_plex)
-        token_sort_score = fuzz.token_sort_ratio(normalized_playlist, normalized_plex)
-
-        # Only allow partial_ratio when title lengths are similar
-        partial_score = 0
-        if len_playlist > 0 and len_plex > 0:
-            length_ratio = max(len_playlist, len_plex) / min(len_playlist, len_plex)
-            if length_ratio <= 2.0:
-                partial_score = fuzz.partial_ratio(normalized_playlist, normalized_plex)
+    if not plex_shows:
+        return [MatchResult(playlist_title=title) for title in playlist_titles]
+
+    # Titles that normalize alike always get the same match, so each
+    # distinct normalized title is only scored once
+    normalized_playlist = [normalize_title(title) for title in playlist_titles]
+    unique_titles = list(dict.fromkeys(normalized_playlist))
+    best_idx = np.zeros(len(unique_titles), dtype=np.intp)
+    best_scores = np.zeros(len(unique_titles), dtype=np.uint8)
+    best_ratios = np.zeros(len(unique_titles), dtype=np.uint8)
+
+    # Titles that normalize to the same string as a Plex show score 100 on
+    # every strategy, so resolve them with a dict lookup instead of
+    # scoring. Like the argmax below, the first such show wins.
+    exact_index = {}
+    for idx, title in enumerate(normalized_plex):
+        exact_index.setdefault(title, idx)
+
+    fuzzy_rows = []
+    for row, title in enumerate(unique_titles):
+        idx = exact_index.get(title)
+        if idx is None:
+            fuzzy_rows.append(row)
+        else:
+            best_idx[row] = idx
+            best_scores[row] = best_ratios[row] = 100
 
-        score = max(ratio_score, token_sort_score, partial_score)
+    min_ratio = 70
+    if fuzzy_rows:
+        fuzzy_rows = np.array(fuzzy_rows)
+        scores, ratio_scores = score_titles(
+            [unique_titles[i] for i in fuzzy_rows], normalized_plex,
+            score_cutoff=threshold, min_ratio=min_ratio, best_only=True,
+        )
 
         # Use (score, ratio) as sort key: when combined scores tie,
         # prefer the candidate with the higher basic ratio — this stops
         # "Castlevania" from beating "Castlevania: Nocturne" via partial
-        if (score, ratio_score) > (best_score, best_ratio):
-            best_score = score
-            best_ratio = ratio_score
-            best_show = show
+        sort_key = scores.astype(np.uint16) * 256 + ratio_scores
+        fuzzy_idx = sort_key.argmax(axis=1)
+        rows = np.arange(len(fuzzy_rows))
+        best_idx[fuzzy_rows] = fuzzy_idx
+        best_scores[fuzzy_rows] = scores[rows, fuzzy_idx]
+        best_ratios[fuzzy_rows] = ratio_scores[rows, fuzzy_idx]
 
     # Require both:
     # 1. Best combined score meets the configured threshold
     # 2. Basic ratio >= 70 to prevent spurious partial/token matches
-    min_ratio = 70
-    if best_score >= threshold and best_ratio >= min_ratio and best_show:
-        return MatchResult(
-            playlist_title=playlist_title,
-            plex_show=best_show,
-            plex_title=best_show.title,
-            score=best_score,
-            matched=True,
+    matched = (best_scores >= threshold) & (best_ratios >= min_ratio)
+
+    # Scores below the threshold or ruled out by title length were not
+    # computed exactly, so rescore unmatched titles without a cutoff to
+    # keep their reported best score accurate
+    unmatched = np.flatnonzero(~matched)
+    if unmatched.size:
+        exact_scores, _ = score_titles(
+            [unique_titles[i] for i in unmatched], normalized_plex,
+            best_only=True,
         )
+        best_scores[unmatched] = exact_scores.max(axis=1)
+
+    row_of = {title: row for row, title in enumerate(unique_titles)}
+    rows = [row_of[title] for title in normalized_playlist]
+    best_idx, best_scores, matched = best_idx[rows], best_scores[rows], matched[rows]
+
+    results = []
+    for title, idx, score, is_match in zip(
+        playlist_titles, best_idx.tolist(), best_scores.tolist(), matched.tolist()
+    ):
+        if is_match:
+            best_show = plex_shows[idx]
+            results.append(MatchResult(
+                playlist_title=title,
+                plex_show=best_show,
+                plex_title=best_show.title,
+                score=score,
+                matched=True,
+            ))
+        else:
+            results.append(MatchResult(playlist_title=title, score=score))
 
-    return MatchResult(playlist_title=playlist_title, score=best_score)
+    return results
 
 
 def find_top_candidates(
-    playlist_title: str,
+    playlist_titles: list[str],
     plex_shows: list,
+    normalized_plex: list[str],
     max_results: int = 5,
-) -> list[tuple[str, int]]:
+) -> list[list[tuple[str, int]]]:
     """
-    Return the top N Plex shows by fuzzy score for a given title.
+    Return the top N Plex shows by fuzzy score for each given title.
 
-    Used in interactive mode to present candidates to the user.
-    Returns list of (plex_title, score) tuples, sorted by score descending.
+    Used in interactive mode to present candidates to the user. All titles
+    are scored in one batch. Returns one list of (plex_title, score) tuples
+    per title, sorted by score descending.
     """
-    normalized_playlist = normalize_title(playlist_title)
-    len_playlist = len(normalized_playlist)
-    scored = []
+    if not plex_shows:
+        return [[] for _ in playlist_titles]
+
+    scores, _ = score_titles(
+        [normalize_title(title) for title in playlist_titles], normalized_plex,
+    )
+
+    top = np.argsort(-scores.astype(np.int16), axis=1, kind="stable")[:, :max_results]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    return [
+        [(plex_shows[i].title, score) for i, score in zip(row, row_scores)]
+        for row, row_scores in zip(top.tolist(), top_scores.tolist())
+    ]
 
-    for show in plex_shows:
-        normalized_plex = normalize_title(show.title)
-        len_plex = len(normalized_plex)
 
-        ratio_score = fuzz.ratio(normalized_playlist, normalized_plex)
-        token_sort_score = fuzz.token_sort_ratio(normalized_playlist, normalized_plex)
+# ── Plex Library Cache ────────────────────────────────────────────────────────
 
-        partial_score = 0
-        if len_playlist > 0 and len_plex > 0:
-            length_ratio = max(len_playlist, len_plex) / min(len_playlist, len_plex)
-            if length_ratio <= 2.0:
-                partial_score = fuzz.partial_ratio(normalized_playlist, normalized_plex)
+# Top-level key marking a file as a library cache; its value is the format
+CACHE_MARKER = "kodi2plex_library_cache"
+CACHE_FORMAT = 1
 
-        score = max(ratio_score, token_sort_score, partial_score)
-        scored.append((show.title, score))
 
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:max_results]
+@dataclass(slots=True)
+class CachedShow:
+    """A Plex show loaded from the library cache: just enough to match on."""
+    title: str
+    ratingKey: int
+    librarySectionID: int
+
+
+def load_library_cache(cache_file: str, logger: logging.Logger) -> dict | None:
+    """
+    Load the per-library entries of the library cache.
+
+    A missing file starts an empty cache. Any other file without the cache
+    marker (unreadable, not JSON, or JSON such as config.json) is left
+    untouched: None is returned, so the run fetches every library and
+    never overwrites it.
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        data = None
+    if (
+        isinstance(data, dict)
+        and data.get(CACHE_MARKER) == CACHE_FORMAT
+        and isinstance(data.get("libraries"), dict)
+    ):
+        return data["libraries"]
+    logger.warning(
+        "%s is not a library cache; leaving it untouched and fetching all shows",
+        cache_file,
+    )
+    return None
+
+
+def save_library_cache(
+    cache_file: str,
+    cache: dict,
+    logger: logging.Logger,
+) -> None:
+    """Write the library cache; a failed write only costs a refetch next run."""
+    try:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {CACHE_MARKER: CACHE_FORMAT, "libraries": cache},
+                f, ensure_ascii=False,
+            )
+    except OSError as e:
+        logger.warning("Could not write library cache %s: %s", cache_file, e)
+
+
+def fetch_library_shows(library, cache: dict | None) -> list:
+    """
+    Fetch all shows in a library, reusing the cached titles while the
+    library is unchanged.
+
+    cache maps library UUIDs to the (ratingKey, title) pairs of their
+    shows, stamped with the library's updatedAt time and show count, and
+    is updated in place when a library is refetched. Cached shows come
+    back as CachedShow objects; a malformed entry counts as a cache miss.
+    With no cache, shows are always fetched.
+    """
+    if cache is not None:
+        updated_at = library.updatedAt
+        stamp = [
+            int(updated_at.timestamp()) if updated_at else None,
+            library.totalSize,
+        ]
+        entry = cache.get(library.uuid)
+        if updated_at and isinstance(entry, dict) and entry.get("stamp") == stamp:
+            rows = entry.get("shows")
+            if isinstance(rows, list) and all(
+                isinstance(row, list) and len(row) == 2
+                and isinstance(row[0], int) and isinstance(row[1], str)
+                for row in rows
+            ):
+                return [
+                    CachedShow(title, rating_key, library.key)
+                    for rating_key, title in rows
+                ]
+
+    # Matching only needs titles and ratingKeys; skip the per-show
+    # guid elements that make up much of the response
+    shows = library.all(includeGuids=False)
+    if cache is not None:
+        cache[library.uuid] = {
+            "stamp": stamp,
+            "shows": [[show.ratingKey, show.title] for show in shows],
+        }
+    return shows
 
 
 # ── Collection Sync ───────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class SyncStats:
     """Tracks sync operation statistics."""
     added: list[str] = field(default_factory=list)
@@ -360,6 +770,54 @@ class SyncStats:
     total_plex_library: int = 0
 
 
+def fetch_collection(library, collection_name: str) -> list:
+    """Fetch the members of the named collection in a library."""
+    shows = []
+    try:
+        found = library.search(
+            title=collection_name, libtype="collection"
+        )
+        for col in found:
+            if col.title == collection_name:
+                shows.extend(col.items())
+    except Exception:
+        pass
+    return shows
+
+
+def group_by_library(shows: list) -> dict[int, list]:
+    """Group Plex shows by the ID of the library section they belong to."""
+    grouped = defaultdict(list)
+    for show in shows:
+        grouped[show.librarySectionID].append(show)
+    return grouped
+
+
+def edit_collection_tag(
+    shows: list,
+    collection_name: str,
+    libraries: list,
+    remove: bool = False,
+) -> None:
+    """
+    Add or remove the collection tag on shows with one multi-edit per library.
+
+    This is the same locked collection tag edit as Show.addCollection and
+    Show.removeCollection, applied to every show in a library at once.
+    Plex creates the collection on the first add and drops it once it
+    has no members left.
+    """
+    libraries_by_id = {library.key: library for library in libraries}
+    for section_id, section_shows in group_by_library(shows).items():
+        library = libraries_by_id[section_id]
+        library.batchMultiEdits(section_shows)
+        if remove:
+            library.removeCollection(collection_name)
+        else:
+            library.addCollection(collection_name)
+        library.saveMultiEdits()
+
+
 def sync_collection(
     config: Config,
     logger: logging.Logger,
@@ -373,50 +831,80 @@ def sync_collection(
     stats = SyncStats()
 
     # ── Fetch playlist from Kodi ──────────────────────────────────────────
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     logger.info("  Kodi2Plex — Sync Smart Playlist → Plex Collection")
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
 
     playlist = fetch_kodi_playlist(config.kodi, logger)
     collection_name = config.collection_name or playlist.name
     stats.total_playlist = len(playlist.titles)
 
-    logger.info(f"Playlist:    {playlist.name}")
-    logger.info(f"Shows:       {len(playlist.titles)}")
-    logger.info(f"Collection:  {collection_name}")
-    logger.info(f"Libraries:   {', '.join(config.library_names)}")
-    logger.info(f"Threshold:   {config.fuzzy_threshold}%")
+    logger.info("Playlist:    %s", playlist.name)
+    logger.info("Shows:       %d", len(playlist.titles))
+    logger.info("Collection:  %s", collection_name)
+    logger.info("Libraries:   %s", ", ".join(config.library_names))
+    logger.info("Threshold:   %s%%", config.fuzzy_threshold)
     if config.dry_run:
         logger.info("Mode:        *** DRY RUN ***")
-    logger.info("-" * 60)
+    logger.info(DIVIDER)
 
     # ── Connect to Plex ───────────────────────────────────────────────────
-    logger.info(f"Connecting to Plex at {config.plex_url}...")
+    logger.info("Connecting to Plex at %s...", config.plex_url)
     plex = PlexServer(config.plex_url, config.plex_token)
 
     # ── Gather shows from all libraries ───────────────────────────────────
+    # plexapi caches the section list after a single /library/sections
+    # request; resolve names up front so worker threads don't race to load it
+    plex_library = plex.library
+    libraries = [plex_library.section(name) for name in config.library_names]
+
+    cache = (
+        load_library_cache(config.cache_file, logger) if config.cache_file else None
+    )
+
+    # Libraries are fetched concurrently; map() keeps the configured order
+    max_workers = max(1, min(8, len(libraries)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        shows_per_library = list(executor.map(
+            lambda lib: fetch_library_shows(lib, cache), libraries,
+        ))
+
+    if cache is not None:
+        save_library_cache(config.cache_file, cache, logger)
+
     all_plex_shows = []
-    libraries = []
-    for lib_name in config.library_names:
-        library = plex.library.section(lib_name)
-        libraries.append(library)
-        shows = library.all()
+    for lib_name, shows in zip(config.library_names, shows_per_library):
         all_plex_shows.extend(shows)
-        logger.info(f"Library '{lib_name}' contains {len(shows)} shows")
+        logger.info("Library '%s' contains %d shows", lib_name, len(shows))
 
     stats.total_plex_library = len(all_plex_shows)
+    # Every attribute read on a plexapi object runs its Python-level
+    # __getattribute__, so read each title once and reuse it below
+    plex_titles = [show.title for show in all_plex_shows]
+    normalized_plex = [normalize_title(title) for title in plex_titles]
     if len(config.library_names) > 1:
-        logger.info(f"Total across all libraries: {len(all_plex_shows)} shows")
-    logger.info("-" * 60)
+        logger.info("Total across all libraries: %d shows", len(all_plex_shows))
+    logger.info(DIVIDER)
 
     # ── Build Plex title lookup for overrides ─────────────────────────────
-    plex_shows_by_title = {show.title.lower(): show for show in all_plex_shows}
+    plex_shows_by_title = {
+        title.lower(): show for title, show in zip(plex_titles, all_plex_shows)
+    }
 
     # ── Match titles ──────────────────────────────────────────────────────
     logger.info("Matching playlist titles to Plex libraries...")
     matched_shows = []
 
-    for title in sorted(playlist.titles):
+    sorted_titles = sorted(playlist.titles)
+    fuzzy_titles = [t for t in sorted_titles if t not in config.title_overrides]
+    fuzzy_results = dict(zip(
+        fuzzy_titles,
+        find_best_matches(
+            fuzzy_titles, all_plex_shows, normalized_plex, config.fuzzy_threshold,
+        ),
+    ))
+
+    for title in sorted_titles:
         # Check manual overrides first
         if title in config.title_overrides:
             override_target = config.title_overrides[title]
@@ -431,48 +919,50 @@ def sync_collection(
                 )
                 matched_shows.append(result)
                 logger.info(
-                    f"  ✓ '{title}' → '{plex_show.title}' (override)",
+                    "  ✓ '%s' → '%s' (override)", title, plex_show.title,
                     extra={"action": "match"},
                 )
                 continue
             else:
                 stats.not_found.append(title)
                 logger.warning(
-                    f"  ✗ '{title}' — override '{override_target}' not found in Plex",
+                    "  ✗ '%s' — override '%s' not found in Plex",
+                    title, override_target,
                     extra={"action": "skip"},
                 )
                 continue
 
         # Fall back to fuzzy matching
-        result = find_best_match(title, all_plex_shows, config.fuzzy_threshold)
+        result = fuzzy_results[title]
         if result.matched:
             matched_shows.append(result)
             if result.playlist_title.lower() != result.plex_title.lower():
                 logger.info(
-                    f"  ✓ '{title}' → '{result.plex_title}' ({result.score}%)",
+                    "  ✓ '%s' → '%s' (%d%%)", title, result.plex_title, result.score,
                     extra={"action": "match"},
                 )
             else:
                 logger.info(
-                    f"  ✓ '{title}' ({result.score}%)",
+                    "  ✓ '%s' (%d%%)", title, result.score,
                     extra={"action": "match"},
                 )
         else:
             stats.not_found.append(title)
             logger.warning(
-                f"  ✗ '{title}' — no match (best score: {result.score}%)",
+                "  ✗ '%s' — no match (best score: %d%%)", title, result.score,
                 extra={"action": "skip"},
             )
 
     logger.info(
-        f"Matched {len(matched_shows)}/{len(playlist.titles)} titles"
+        "Matched %d/%d titles", len(matched_shows), len(playlist.titles),
     )
-    logger.info("-" * 60)
+    logger.info(DIVIDER)
 
     # ── Interactive override builder ──────────────────────────────────────
     if interactive and stats.not_found:
         new_overrides = interactive_resolve(
-            stats.not_found, all_plex_shows, plex_shows_by_title, logger,
+            stats.not_found, all_plex_shows, normalized_plex,
+            plex_shows_by_title, logger,
         )
         if new_overrides:
             # Apply new overrides to this run
@@ -493,38 +983,49 @@ def sync_collection(
             if config_path:
                 save_overrides_to_config(config_path, new_overrides, logger)
 
-            logger.info("-" * 60)
+            logger.info(DIVIDER)
 
     # ── Get current collection members across all libraries ───────────────
-    current_collection_shows = []
-    for library in libraries:
-        try:
-            collections = library.search(
-                title=collection_name, libtype="collection"
-            )
-            for col in collections:
-                if col.title == collection_name:
-                    current_collection_shows.extend(col.items())
-        except Exception:
-            pass
+    # Libraries are searched concurrently, like the show fetch above
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        found = list(executor.map(
+            lambda lib: fetch_collection(lib, collection_name), libraries,
+        ))
 
-    current_ids = {show.ratingKey for show in current_collection_shows}
-    desired_ids = {r.plex_show.ratingKey for r in matched_shows}
+    current_collection_shows = []
+    for shows in found:
+        current_collection_shows.extend(shows)
+
+    # Key both sides by ratingKey once, then partition in a single pass.
+    # Shows matched by more than one playlist title are only added once.
+    current_by_key = {show.ratingKey: show for show in current_collection_shows}
+    desired_by_key = {r.plex_show.ratingKey: r for r in matched_shows}
+
+    to_add = []
+    already = []
+    for key, result in desired_by_key.items():
+        (already if key in current_by_key else to_add).append(result)
+    to_remove = [
+        show for key, show in current_by_key.items() if key not in desired_by_key
+    ]
 
     # ── Add missing shows ─────────────────────────────────────────────────
-    to_add = [r for r in matched_shows if r.plex_show.ratingKey not in current_ids]
-    to_remove = [s for s in current_collection_shows if s.ratingKey not in desired_ids]
 
     if to_add:
         logger.info("Adding to collection:")
         for result in to_add:
             logger.info(
-                f"  + {result.plex_title}",
+                "  + %s", result.plex_title,
                 extra={"action": "add"},
             )
-            if not config.dry_run:
-                result.plex_show.addCollection(collection_name)
             stats.added.append(result.plex_title)
+        if not config.dry_run:
+            shows = [r.plex_show for r in to_add]
+            if any(isinstance(show, CachedShow) for show in shows):
+                # Cached shows can't be edited; load the real ones by
+                # ratingKey in a single request
+                shows = plex.fetchItems([show.ratingKey for show in shows])
+            edit_collection_tag(shows, collection_name, libraries)
     else:
         logger.info("No shows to add.")
 
@@ -533,17 +1034,18 @@ def sync_collection(
         logger.info("Removing from collection:")
         for show in to_remove:
             logger.info(
-                f"  - {show.title}",
+                "  - %s", show.title,
                 extra={"action": "remove"},
             )
-            if not config.dry_run:
-                show.removeCollection(collection_name)
             stats.removed.append(show.title)
+        if not config.dry_run:
+            edit_collection_tag(
+                to_remove, collection_name, libraries, remove=True,
+            )
     else:
         logger.info("No shows to remove.")
 
     # ── Already in sync ───────────────────────────────────────────────────
-    already = [r for r in matched_shows if r.plex_show.ratingKey in current_ids]
     stats.already_in_collection = [r.plex_title for r in already]
 
     return stats
@@ -554,31 +1056,31 @@ def sync_collection(
 def print_summary(stats: SyncStats, logger: logging.Logger, dry_run: bool = False):
     """Print a summary of the sync operation."""
     logger.info("")
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
     prefix = "[DRY RUN] " if dry_run else ""
-    logger.info(f"  {prefix}Sync Summary")
-    logger.info("=" * 60)
-    logger.info(f"  Playlist titles:       {stats.total_playlist}")
-    logger.info(f"  Plex library size:     {stats.total_plex_library}")
-    logger.info(f"  Already in collection: {len(stats.already_in_collection)}")
+    logger.info("  %sSync Summary", prefix)
+    logger.info(SEPARATOR)
+    logger.info("  Playlist titles:       %d", stats.total_playlist)
+    logger.info("  Plex library size:     %d", stats.total_plex_library)
+    logger.info("  Already in collection: %d", len(stats.already_in_collection))
     logger.info(
-        f"  Added:                 {len(stats.added)}",
+        "  Added:                 %d", len(stats.added),
         extra={"action": "add"} if stats.added else {},
     )
     logger.info(
-        f"  Removed:               {len(stats.removed)}",
+        "  Removed:               %d", len(stats.removed),
         extra={"action": "remove"} if stats.removed else {},
     )
 
     if stats.not_found:
         logger.warning(
-            f"  Not found in Plex:     {len(stats.not_found)}",
+            "  Not found in Plex:     %d", len(stats.not_found),
             extra={"action": "skip"},
         )
         for title in stats.not_found:
-            logger.warning(f"    • {title}", extra={"action": "skip"})
+            logger.warning("    • %s", title, extra={"action": "skip"})
 
-    logger.info("=" * 60)
+    logger.info(SEPARATOR)
 
 
 # ── Pushover Notifications ────────────────────────────────────────────────────
@@ -633,9 +1135,9 @@ def send_pushover(
             if resp.status == 200:
                 logger.info("Pushover notification sent successfully")
             else:
-                logger.warning(f"Pushover returned status {resp.status}")
+                logger.warning("Pushover returned status %s", resp.status)
     except Exception as e:
-        logger.error(f"Failed to send Pushover notification: {e}")
+        logger.error("Failed to send Pushover notification: %s", e)
 
 
 # ── Interactive Override Builder ───────────────────────────────────────────────
@@ -643,6 +1145,7 @@ def send_pushover(
 def interactive_resolve(
     unmatched_titles: list[str],
     plex_shows: list,
+    normalized_plex: list[str],
     plex_shows_by_title: dict,
     logger: logging.Logger,
 ) -> dict[str, str]:
@@ -657,20 +1160,25 @@ def interactive_resolve(
     new_overrides = {}
 
     print()
-    print("=" * 60)
+    print(SEPARATOR)
     print("  Interactive Override Builder")
-    print("=" * 60)
+    print(SEPARATOR)
     print(f"  {len(unmatched_titles)} unmatched title(s) to resolve")
     print("  For each title, pick a number, type a Plex title,")
     print("  press Enter to skip, or type 'q' to stop.")
-    print("=" * 60)
+    print(SEPARATOR)
+
+    all_candidates = find_top_candidates(
+        unmatched_titles, plex_shows, normalized_plex, max_results=5,
+    )
 
-    for i, title in enumerate(unmatched_titles, 1):
+    for i, (title, candidates) in enumerate(
+        zip(unmatched_titles, all_candidates), 1
+    ):
         print(f"\n  [{i}/{len(unmatched_titles)}] '{title}'")
         print()
 
         # Show top candidates
-        candidates = find_top_candidates(title, plex_shows, max_results=5)
         for idx, (plex_title, score) in enumerate(candidates, 1):
             print(f"    {idx}. {plex_title} ({score}%)")
 
@@ -721,7 +1229,7 @@ def save_overrides_to_config(
         json.dump(data, f, indent=4, ensure_ascii=False)
         f.write("\n")
 
-    logger.info(f"Saved {len(new_overrides)} new override(s) to {config_path}")
+    logger.info("Saved %d new override(s) to %s", len(new_overrides), config_path)
 
 
 # ── Entry Point ───────────────────────────────────────────────────────────────
@@ -799,10 +1307,10 @@ def main():
                     logger,
                 )
     except FileNotFoundError as e:
-        logger.error(f"File error: {e}")
+        logger.error("File error: %s", e)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         logger.debug("Details:", exc_info=True)
         sys.exit(1)
 
@@ -0,0 +1,117 @@
+"""Regression tests for Kodi2Plex title matching."""
+
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+
+import pytest
+from rapidfuzz import fuzz, utils
+
+from kodi2plex import find_best_matches, find_top_candidates, normalize_title
+
+
+@dataclass
+class FakeShow:
+    """Stand-in for a plexapi Show; matching only reads the title."""
+    title: str
+
+
+def match(playlist_title: str, plex_titles: list[str], threshold: int):
+    """Match one playlist title against Plex shows with the given titles."""
+    shows = [FakeShow(title) for title in plex_titles]
+    normalized_plex = [normalize_title(title) for title in plex_titles]
+    return find_best_matches([playlist_title], shows, normalized_plex, threshold)[0]
+
+
+def test_score_rounding_up_to_threshold_matches():
+    # token_sort_ratio is 86.67, which rounds up to the 87% threshold
+    result = match("Office Next Kin", ["Gen Office Next"], threshold=87)
+    assert result.matched
+    assert result.plex_title == "Gen Office Next"
+    assert result.score == 87
+
+
+def test_partial_rounding_up_to_row_best_is_kept():
+    # 'ab moms' scores 86 on token_sort_ratio but fails the ratio >= 70
+    # guard; 'moms dark' ties it with a partial_ratio of 85.71 and a
+    # ratio of 75, so it must survive the row-best cutoff and win
+    result = match("Moms An (2014)", ["Ab Moms", "Moms Dark (2014)"], threshold=70)
+    assert result.matched
+    assert result.plex_title == "Moms Dark (2014)"
+    assert result.score == 86
+
+
+def test_scores_round_half_to_even():
+    # partial_ratio is exactly 62.5: round() gives 62, not 63
+    shows = [FakeShow("abc x lost star")]
+    normalized_plex = [normalize_title(show.title) for show in shows]
+    candidates = find_top_candidates(["star trek"], shows, normalized_plex)
+    assert candidates == [[("abc x lost star", 62)]]
+    result = find_best_matches(["star trek"], shows, normalized_plex, 63)[0]
+    assert not result.matched
+    assert result.score == 62
+
+
+def test_accented_title_matches():
+    # thefuzz's token_sort_ratio drops the 'é' before comparing, scoring 91;
+    # the plain ratio is only 83
+    result = match("Amélie", ["Amelie"], threshold=85)
+    assert result.matched
+    assert result.plex_title == "Amelie"
+    assert result.score == 91
+
+
+@lru_cache(maxsize=None)
+def thefuzz_process(title: str) -> str:
+    """thefuzz's full_process(force_ascii=True), used by token_sort_ratio."""
+    return utils.default_process(title.translate(dict.fromkeys(range(128, 256))))
+
+
+def reference_match(playlist_title: str, shows: list, threshold: int):
+    """The original one-show-at-a-time matching loop, without any pruning."""
+    normalized_playlist = normalize_title(playlist_title)
+    best_score, best_ratio, best_show = 0, 0, None
+    for show in shows:
+        normalized_plex = normalize_title(show.title)
+        ratio_score = round(fuzz.ratio(normalized_playlist, normalized_plex))
+        token_sort_score = round(fuzz.token_sort_ratio(
+            normalized_playlist, normalized_plex, processor=thefuzz_process,
+        ))
+        partial_score = 0
+        shorter, longer = sorted((len(normalized_playlist), len(normalized_plex)))
+        if shorter and longer <= 2 * shorter:
+            partial_score = round(
+                fuzz.partial_ratio(normalized_playlist, normalized_plex)
+            )
+        score = max(ratio_score, token_sort_score, partial_score)
+        if (score, ratio_score) > (best_score, best_ratio):
+            best_score, best_ratio, best_show = score, ratio_score, show
+    matched = best_score >= threshold and best_ratio >= 70 and best_show is not None
+    return matched, best_show.title if matched else None, best_score
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_reference_loop(seed):
+    # A small shared vocabulary produces many near-ties and length-pruned
+    # pairs; accented and underscored words are preprocessed differently by
+    # token_sort_ratio than by ratio and partial_ratio
+    rnd = random.Random(seed)
+    words = (
+        "office next kin gen moms an dark ab star trek lost the of night "
+        "amélie amelie pokémon pokemon méxico mexico x_files files"
+    ).split()
+
+    def random_title():
+        words_used = rnd.choices(words, k=rnd.randint(1, 4))
+        return " ".join(words_used) + rnd.choice(["", " (2014)"])
+
+    shows = [FakeShow(random_title()) for _ in range(120)]
+    playlist_titles = [random_title() for _ in range(40)]
+    normalized_plex = [normalize_title(show.title) for show in shows]
+    for threshold in (50, 70, 80, 87, 95):
+        results = find_best_matches(
+            playlist_titles, shows, normalized_plex, threshold,
+        )
+        for title, result in zip(playlist_titles, results):
+            got = result.matched, result.plex_title, result.score
+            assert got == reference_match(title, shows, threshold), title